@@ -28,6 +28,7 @@
 
 from enum import IntEnum
 from random import randint
+from typing import Optional
 from ovos_bus_client.message import Message
 from neon_utils.skills.neon_skill import NeonSkill
 from neon_utils.validator_utils import numeric_confirmation_validator
@@ -53,6 +54,26 @@ class DataControlsSkill(NeonSkill):
         ALL_UNITS = 7
         ALL_LANGUAGE = 8
 
+    # Dialog describing each kind of data in spoken confirmations
+    _DIALOG_WORDS = {UserData.CACHES: "word_caches",
+                     UserData.PROFILE: "word_profile_data",
+                     UserData.ALL_TR: "word_transcriptions",
+                     UserData.CONF_LIKES: "word_liked_brands",
+                     UserData.CONF_DISLIKES: "word_disliked_brands",
+                     UserData.ALL_DATA: "word_all_data",
+                     UserData.ALL_MEDIA: "word_media",
+                     UserData.ALL_UNITS: "word_units",
+                     UserData.ALL_LANGUAGE: "word_language"}
+
+    # Data stored by other services and removed via `neon.clear_data`
+    _DOWNSTREAM_DATA = (UserData.CACHES, UserData.ALL_TR, UserData.CONF_LIKES,
+                        UserData.ALL_MEDIA, UserData.ALL_DATA)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.add_event("neon.data_controls.get_erase_plan",
+                       self.handle_get_erase_plan)
+
     @classproperty
     def runtime_requirements(self):
         return RuntimeRequirements(network_before_load=False,
@@ -65,6 +86,27 @@ class DataControlsSkill(NeonSkill):
                                    no_network_fallback=True,
                                    no_gui_fallback=True)
 
+    def handle_get_erase_plan(self, message: Message):
+        """
+        Handles a request to preview the changes a data erase would make.
+        No data is modified. The returned plan is informational only; an erase
+        is only performed through the skill's own confirmation flow.
+        :param message: Message with `data_to_remove` (list of UserData names)
+            and optional `username`
+        """
+        username = message.data.get("username") or \
+            get_message_user(message) or "local"
+        try:
+            to_clear = [self.UserData[name] for name in
+                        message.data.get("data_to_remove") or []]
+        except KeyError as e:
+            LOG.warning(f"Invalid data type requested: {e}")
+            self.bus.emit(message.response({"error": f"Invalid data type: "
+                                                     f"{e}"}))
+            return
+        plan = self._get_erase_plan(to_clear, username, message)
+        self.bus.emit(message.response({"plan": plan}))
+
     @intent_handler("clear_data.intent")
     def handle_data_erase(self, message: Message):
         """
@@ -121,88 +163,219 @@ class DataControlsSkill(NeonSkill):
             to_clear = None
 
         if dialog_opt:
-            validator = numeric_confirmation_validator(str(confirm_number))
+            user = get_message_user(message) or "local"
+            # Plan once before prompting; the same plan is previewed and then
+            # executed, so it must not be recomputed after confirmation
+            plan = self._get_erase_plan(to_clear, user, message)
+            option = self.translate(dialog_opt)
+            confirm_validator = \
+                numeric_confirmation_validator(str(confirm_number))
+
+            def validator(utt):
+                return confirm_validator(utt) or self.voc_match(utt,
+                                                                "preview")
+
             resp = self.get_response('ask_clear_data',
-                                     {'option': self.translate(dialog_opt),
+                                     {'option': option,
                                       'confirm': str(confirm_number)},
                                      validator)
             LOG.info(resp)
+            if isinstance(resp, str) and not confirm_validator(resp):
+                # User asked to preview changes before confirming
+                self._speak_erase_plan(plan, option)
+                resp = self.get_response('ask_clear_data',
+                                         {'option': option,
+                                          'confirm': str(confirm_number)},
+                                         confirm_validator)
             if resp:
-                user = get_message_user(message) or "local"
-                for dtype in to_clear:
-                    self._clear_user_data(dtype, message, user)
-
-                self.bus.emit(message.forward("neon.clear_data",
-                                              {"username": user,
-                                               "data_to_remove": [dtype.name
-                                                                  for dtype in
-                                                                  to_clear]}))
+                self._execute_erase_plan(plan, message)
             else:
                 self.speak_dialog("confirm_no_action", private=True)
         else:
             LOG.warning(f"Invalid data type requested: {opt}")
 
+    def _get_erase_plan(self, to_clear: list, username: str,
+                        message: Message = None) -> dict:
+        """
+        Build a serializable plan of the changes clearing `to_clear` would
+        make. No data is modified.
+        :param to_clear: list of UserData to clear
+        :param username: string username to plan changes for
+        :param message: Message associated with request, used to read the
+            user's current profile
+        :returns: dict plan to pass to `_execute_erase_plan`. `changed_keys`
+            is None for each step if the user's profile is not in `message`
+        """
+        default_config = get_user_config_from_mycroft_conf()
+        default_config["user"]["username"] = username
+        current_prefs = self._get_user_profile(username, message)
+        steps = list()
+        for dtype in to_clear:
+            profile_update = self._get_profile_update(dtype, default_config)
+            changed_keys = None if current_prefs is None else \
+                self._get_changed_keys(profile_update, current_prefs)
+            steps.append({"data_type": dtype.name,
+                          "profile_update": profile_update,
+                          "changed_keys": changed_keys,
+                          "downstream": dtype in self._DOWNSTREAM_DATA})
+        return {"username": username,
+                "data_to_remove": [dtype.name for dtype in to_clear],
+                "steps": steps}
+
+    @staticmethod
+    def _get_user_profile(username: str,
+                          message: Message = None) -> Optional[dict]:
+        """
+        Get the current profile for `username` from `message` context. This is
+        the profile that `update_profile` changes, so no other config is read.
+        :param username: string username to get a profile for
+        :param message: Message associated with request
+        :returns: dict user profile, or None if the profile is not available
+        """
+        if message:
+            for profile in message.context.get("user_profiles") or []:
+                if profile.get("user", {}).get("username") == username:
+                    return profile
+        return None
+
+    def _get_plan_kinds(self, steps: list) -> str:
+        """
+        Get a spoken list of the kinds of data described by plan steps.
+        :param steps: list of erase plan steps
+        :returns: translated, comma-separated kinds of data without duplicates
+        """
+        kinds = list()
+        for step in steps:
+            kind = self.translate(
+                self._DIALOG_WORDS[self.UserData[step["data_type"]]])
+            if kind not in kinds:
+                kinds.append(kind)
+        return ", ".join(kinds)
+
+    def _speak_erase_plan(self, plan: dict, option: str):
+        """
+        Speaks a summary of the changes an erase plan will make.
+        :param plan: dict erase plan to describe
+        :param option: translated description of the requested data
+        """
+        self.speak_dialog("preview_erase_plan", {"option": option},
+                          private=True)
+        profile_steps = [step for step in plan["steps"]
+                         if step["profile_update"]]
+        if profile_steps:
+            count = self._count_changed_keys(plan)
+            if count is None:
+                self.speak_dialog("preview_profile_reset",
+                                  {"kinds": self._get_plan_kinds(
+                                      profile_steps)}, private=True)
+            elif count:
+                changed_steps = [step for step in profile_steps
+                                 if step["changed_keys"]]
+                self.speak_dialog("preview_profile_changes",
+                                  {"count": str(count),
+                                   "kinds": self._get_plan_kinds(
+                                       changed_steps)}, private=True)
+            else:
+                self.speak_dialog("preview_no_profile_changes", private=True)
+        for step in plan["steps"]:
+            if step["downstream"]:
+                dtype = self.UserData[step["data_type"]]
+                self.speak_dialog("preview_downstream_data",
+                                  {"kind": self.translate(
+                                      self._DIALOG_WORDS[dtype])},
+                                  private=True)
+
+    def _execute_erase_plan(self, plan: dict, message: Message):
+        """
+        Perform the erase described by a plan from `_get_erase_plan` and
+        notify other services to remove their data. The plan is a snapshot
+        taken before confirmation and is applied as-is, not recomputed.
+        :param plan: dict erase plan to execute
+        :param message: Message associated with request
+        """
+        username = plan["username"]
+        for step in plan["steps"]:
+            self._clear_user_data(self.UserData[step["data_type"]], message,
+                                  username, step["profile_update"])
+        self.bus.emit(message.forward("neon.clear_data",
+                                      {"username": username,
+                                       "data_to_remove":
+                                           plan["data_to_remove"]}))
+
+    def _get_profile_update(self, data_type: UserData,
+                            default_config: dict) -> dict:
+        """
+        Get the profile changes required to clear the requested `data_type`.
+        :param data_type: UserData to clear
+        :param default_config: default user config to reset values to
+        :returns: dict profile update (empty if no profile changes)
+        """
+        if data_type == self.UserData.ALL_DATA:
+            return default_config
+        if data_type == self.UserData.CONF_DISLIKES:
+            return {"brands": {"ignored_brands": {}}}
+        if data_type == self.UserData.PROFILE:
+            return {"user": default_config["user"]}
+        if data_type == self.UserData.ALL_UNITS:
+            return {"units": default_config["units"]}
+        if data_type == self.UserData.ALL_LANGUAGE:
+            return {"speech": default_config["speech"]}
+        return dict()
+
+    @staticmethod
+    def _get_changed_keys(profile_update: dict, current_prefs: dict) -> dict:
+        """
+        Get the profile keys that a `profile_update` would change. The
+        username is never reset, so it is not reported.
+        :param profile_update: dict profile update to apply
+        :param current_prefs: dict current user profile
+        :returns: dict of profile section to list of changed keys
+        """
+        changed = dict()
+        for section, values in profile_update.items():
+            current = current_prefs.get(section) or dict()
+            keys = [key for key, val in values.items()
+                    if current.get(key) != val and
+                    (section, key) != ("user", "username")]
+            if keys:
+                changed[section] = keys
+        return changed
+
+    @staticmethod
+    def _count_changed_keys(plan: dict) -> Optional[int]:
+        """
+        Count the profile values an erase plan would change.
+        :param plan: dict erase plan
+        :returns: number of profile values to be reset, None if unknown
+        """
+        if any(step["changed_keys"] is None for step in plan["steps"]):
+            return None
+        return sum(len(keys) for step in plan["steps"]
+                   for keys in step["changed_keys"].values())
+
     def _clear_user_data(self, data_type: UserData,
-                         message: Message, username: str):
+                         message: Message, username: str,
+                         profile_update: dict = None):
         """
         Speaks a confirmation and performs any necessary profile updates for the
         requested `data_type`.
         :param data_type: UserData to clear
         :param message: Message associated with request
         :param username: string username to update profile for
+        :param profile_update: planned profile update; computed if None
         """
-        default_config = get_user_config_from_mycroft_conf()
-        default_config["user"]["username"] = username
-        LOG.info(f"Clearing profile for: {username}")
+        if profile_update is None:
+            default_config = get_user_config_from_mycroft_conf()
+            default_config["user"]["username"] = username
+            profile_update = self._get_profile_update(data_type,
+                                                      default_config)
+        LOG.info(f"Clearing {data_type.name} for: {username}")
         if data_type == self.UserData.ALL_DATA:
             self.speak_dialog("confirm_clear_all", private=True)
-            self.update_profile(default_config, message)
-            return
-        if data_type == self.UserData.CONF_LIKES:
-            self.speak_dialog("confirm_clear_data",
-                              {"kind": self.translate("word_liked_brands")},
-                              private=True)
-            return
-        if data_type == self.UserData.CONF_DISLIKES:
-            self.speak_dialog("confirm_clear_data",
-                              {"kind": self.translate("word_disliked_brands")},
-                              private=True)
-            updated_config = {"brands": {"ignored_brands": {}}}
-            self.update_profile(updated_config, message)
-            return
-        if data_type == self.UserData.ALL_TR:
-            self.speak_dialog("confirm_clear_data",
-                              {"kind": self.translate("word_transcriptions")},
-                              private=True)
-            return
-        if data_type == self.UserData.PROFILE:
-            self.speak_dialog("confirm_clear_data",
-                              {"kind": self.translate("word_profile_data")},
-                              private=True)
-            updated_config = default_config["user"]
-            self.update_profile({"user": updated_config}, message)
-            return
-        if data_type == self.UserData.CACHES:
-            self.speak_dialog("confirm_clear_data",
-                              {"kind": self.translate("word_caches")},
-                              private=True)
-            return
-        if data_type == self.UserData.ALL_UNITS:
-            self.speak_dialog("confirm_clear_data",
-                              {"kind": self.translate("word_units")},
-                              private=True)
-            updated_config = default_config["units"]
-            self.update_profile({"units": updated_config}, message)
-            return
-        if data_type == self.UserData.ALL_MEDIA:
-            self.speak_dialog("confirm_clear_data",
-                              {"kind": self.translate("word_media")},
-                              private=True)
-            return
-        if data_type == self.UserData.ALL_LANGUAGE:
+        else:
             self.speak_dialog("confirm_clear_data",
-                              {"kind": self.translate("word_language")},
+                              {"kind": self.translate(
+                                  self._DIALOG_WORDS[data_type])},
                               private=True)
-            updated_config = default_config["speech"]
-            self.update_profile({"speech": updated_config}, message)
-            return
+        if profile_update:
+            self.update_profile(profile_update, message)
@@ -33,7 +33,7 @@ import pytest
 from threading import Event
 from os.path import dirname, join
 from mock import Mock
-from mock.mock import call
+from mock.mock import call, ANY
 from ovos_bus_client import Message
 from neon_utils.configuration_utils import get_neon_user_config, \
     get_user_config_from_mycroft_conf
@@ -46,6 +46,11 @@ class TestSkillMethods(SkillTestCase):
         from neon_utils.skills import NeonSkill
 
         self.assertIsInstance(self.skill, NeonSkill)
+        self.assertTrue(self.skill.bus.ee.listeners(
+            "neon.data_controls.get_erase_plan"))
+        self.assertIn(f"{self.skill.skill_id}:neon.load_cache_on_disk",
+                      [event[0] for event in
+                       self.skill.event_scheduler.events.events])
 
     def test_handle_data_erase(self):
         real_get_response = self.skill.get_response
@@ -121,7 +126,7 @@ class TestSkillMethods(SkillTestCase):
 
         def _check_clear_user_data(dtype, message):
             self.skill._clear_user_data.assert_called_with(dtype, message,
-                                                           "local")
+                                                           "local", ANY)
             self.assertTrue(bus_event.wait(3))
             # Session context is mutable; skip comparison
             # self.assertEqual(clear_data_message.context, message.context)
@@ -151,8 +156,10 @@ class TestSkillMethods(SkillTestCase):
         self.skill.handle_data_erase(brands_message)
         _check_get_response("word_all_brands", True)
         self.skill._clear_user_data.assert_has_calls([
-            call(self.skill.UserData.CONF_LIKES, brands_message, "local"),
-            call(self.skill.UserData.CONF_DISLIKES, brands_message, "local")
+            call(self.skill.UserData.CONF_LIKES, brands_message, "local",
+                 {}),
+            call(self.skill.UserData.CONF_DISLIKES, brands_message, "local",
+                 {"brands": {"ignored_brands": {}}})
         ])
         bus_event.wait(5)
         # Session context is mutable; skip comparison
@@ -202,6 +209,202 @@ class TestSkillMethods(SkillTestCase):
         self.skill.get_response = real_get_response
         self.skill._clear_user_data = real_clear_user_data
 
+    def test_handle_data_erase_preview(self):
+        real_get_response = self.skill.get_response
+        real_execute_erase_plan = self.skill._execute_erase_plan
+        self.skill._execute_erase_plan = Mock()
+        profile = get_user_config_from_mycroft_conf()
+        profile["user"]["username"] = "alice"
+        profile["units"]["time"] = 12 if profile["units"]["time"] == 24 \
+            else 24
+        context = {"username": "alice", "user_profiles": [profile]}
+        units_message = Message("test", {"dataset": "format"}, context)
+        cache_message = Message("test", {"dataset": "cached data"}, context)
+
+        # Preview then cancel
+        self.skill.get_response = Mock(side_effect=["preview", None])
+        self.skill.handle_data_erase(units_message)
+        self.assertEqual(self.skill.get_response.call_count, 2)
+        self.skill.speak_dialog.assert_has_calls([
+            call("preview_erase_plan",
+                 {"option": self.skill.translate("word_units")},
+                 private=True),
+            call("preview_profile_changes",
+                 {"count": "1", "kinds": self.skill.translate("word_units")},
+                 private=True),
+            call("confirm_no_action", private=True)])
+        # Preview is not accepted as confirmation on the second prompt
+        confirm_validator = self.skill.get_response.call_args[0][2]
+        self.assertFalse(confirm_validator("preview"))
+        self.skill._execute_erase_plan.assert_not_called()
+
+        # Preview then confirm executes the previewed plan
+        self.skill.get_response = Mock(side_effect=["preview", True])
+        self.skill.handle_data_erase(units_message)
+        plan = self.skill._execute_erase_plan.call_args[0][0]
+        self.assertEqual(plan["data_to_remove"], ["ALL_UNITS"])
+        self.assertEqual(self.skill._execute_erase_plan.call_args[0][1],
+                         units_message)
+
+        # Downstream data is described even with no profile changes
+        self.skill.speak_dialog.reset_mock()
+        self.skill.get_response = Mock(side_effect=["preview", None])
+        self.skill.handle_data_erase(cache_message)
+        self.assertEqual(self.skill.speak_dialog.call_args_list, [
+            call("preview_erase_plan",
+                 {"option": self.skill.translate("word_caches")},
+                 private=True),
+            call("preview_downstream_data",
+                 {"kind": self.skill.translate("word_caches")},
+                 private=True),
+            call("confirm_no_action", private=True)])
+
+        self.skill.get_response = real_get_response
+        self.skill._execute_erase_plan = real_execute_erase_plan
+
+    def test_speak_erase_plan(self):
+        default_config = get_user_config_from_mycroft_conf()
+        plan = {"username": "bob",
+                "data_to_remove": ["ALL_UNITS"],
+                "steps": [{"data_type": "ALL_UNITS",
+                           "profile_update": {
+                               "units": default_config["units"]},
+                           "changed_keys": None,
+                           "downstream": False}]}
+        self.skill._speak_erase_plan(plan, "units")
+        self.skill.speak_dialog.assert_called_with(
+            "preview_profile_reset",
+            {"kinds": self.skill.translate("word_units")}, private=True)
+
+        # Each kind of data is spoken once
+        plan["steps"].append(dict(plan["steps"][0]))
+        self.skill._speak_erase_plan(plan, "units")
+        self.skill.speak_dialog.assert_called_with(
+            "preview_profile_reset",
+            {"kinds": self.skill.translate("word_units")}, private=True)
+        plan["steps"].pop()
+
+        plan["steps"][0]["changed_keys"] = {}
+        self.skill._speak_erase_plan(plan, "units")
+        self.skill.speak_dialog.assert_called_with(
+            "preview_no_profile_changes", private=True)
+
+    def test_get_erase_plan(self):
+        default_config = get_user_config_from_mycroft_conf()
+        alice_profile = get_user_config_from_mycroft_conf()
+        alice_profile["user"]["username"] = "alice"
+        alice_profile["units"]["time"] = \
+            12 if default_config["units"]["time"] == 24 else 24
+        alice_profile["brands"]["ignored_brands"] = {"brand": 1}
+        bob_profile = get_user_config_from_mycroft_conf()
+        bob_profile["user"]["username"] = "bob"
+        alice_message = Message("test", {},
+                                {"username": "alice",
+                                 "user_profiles": [alice_profile]})
+        to_clear = [self.skill.UserData.CONF_LIKES,
+                    self.skill.UserData.CONF_DISLIKES,
+                    self.skill.UserData.ALL_UNITS,
+                    self.skill.UserData.PROFILE]
+        real_update_profile = self.skill.update_profile
+        self.skill.update_profile = Mock()
+
+        plan = self.skill._get_erase_plan(to_clear, "alice", alice_message)
+        self.assertEqual(plan["username"], "alice")
+        self.assertEqual(plan["data_to_remove"],
+                         ["CONF_LIKES", "CONF_DISLIKES", "ALL_UNITS",
+                          "PROFILE"])
+        self.assertEqual([step["downstream"] for step in plan["steps"]],
+                         [True, False, False, False])
+        self.assertEqual(plan["steps"][0]["profile_update"], {})
+        self.assertEqual(plan["steps"][1]["profile_update"],
+                         {"brands": {"ignored_brands": {}}})
+        self.assertEqual(plan["steps"][2]["profile_update"],
+                         {"units": default_config["units"]})
+        self.assertEqual(plan["steps"][3]["profile_update"]["user"]
+                         ["username"], "alice")
+        # Only values that differ from the user's profile are reported
+        self.assertEqual([step["changed_keys"] for step in plan["steps"]],
+                         [{}, {"brands": ["ignored_brands"]},
+                          {"units": ["time"]}, {}])
+        self.assertEqual(self.skill._count_changed_keys(plan), 2)
+        self.skill.update_profile.assert_not_called()
+
+        # Another user's profile is not used for the requested user
+        plan = self.skill._get_erase_plan(to_clear, "bob", alice_message)
+        self.assertEqual(plan["username"], "bob")
+        self.assertTrue(all(step["changed_keys"] is None
+                            for step in plan["steps"]))
+        self.assertIsNone(self.skill._count_changed_keys(plan))
+        alice_message.context["user_profiles"].append(bob_profile)
+        plan = self.skill._get_erase_plan(to_clear, "bob", alice_message)
+        self.assertEqual([step["changed_keys"] for step in plan["steps"]],
+                         [{}, {}, {}, {}])
+
+        # Changes are unknown without a profile to compare
+        plan = self.skill._get_erase_plan(to_clear, "test_user")
+        self.assertIsNone(self.skill._count_changed_keys(plan))
+        plan = self.skill._get_erase_plan(to_clear, "local", Message("test"))
+        self.assertIsNone(self.skill._count_changed_keys(plan))
+
+        # Plan is executable
+        bus_event = Event()
+        clear_data_message = None
+
+        def _handle_data_clear(message):
+            nonlocal clear_data_message
+            clear_data_message = message
+            bus_event.set()
+
+        self.skill.bus.on("neon.clear_data", _handle_data_clear)
+        plan = self.skill._get_erase_plan(to_clear, "alice", alice_message)
+        self.skill._execute_erase_plan(plan, alice_message)
+        self.skill.update_profile.assert_has_calls([
+            call({"brands": {"ignored_brands": {}}}, alice_message),
+            call({"units": default_config["units"]}, alice_message),
+            call({"user": plan["steps"][3]["profile_update"]["user"]},
+                 alice_message)])
+        self.assertEqual(self.skill.update_profile.call_count, 3)
+        self.assertTrue(bus_event.wait(3))
+        self.assertEqual(clear_data_message.data,
+                         {"username": "alice",
+                          "data_to_remove": plan["data_to_remove"]})
+        self.skill.bus.remove("neon.clear_data", _handle_data_clear)
+
+        self.skill.update_profile = real_update_profile
+
+    def test_handle_get_erase_plan(self):
+        real_update_profile = self.skill.update_profile
+        self.skill.update_profile = Mock()
+        profile = get_user_config_from_mycroft_conf()
+        profile["user"]["username"] = "alice"
+        response = self.skill.bus.wait_for_response(
+            Message("neon.data_controls.get_erase_plan",
+                    {"username": "alice",
+                     "data_to_remove": ["ALL_LANGUAGE"]},
+                    {"username": "alice", "user_profiles": [profile]}))
+        plan = response.data["plan"]
+        self.assertEqual(plan["username"], "alice")
+        self.assertEqual(plan["data_to_remove"], ["ALL_LANGUAGE"])
+        self.assertEqual(list(plan["steps"][0]["profile_update"].keys()),
+                         ["speech"])
+        self.assertIsInstance(plan["steps"][0]["changed_keys"], dict)
+        self.skill.update_profile.assert_not_called()
+
+        # Plan for a user whose profile was not provided
+        response = self.skill.bus.wait_for_response(
+            Message("neon.data_controls.get_erase_plan",
+                    {"username": "bob",
+                     "data_to_remove": ["ALL_LANGUAGE"]},
+                    {"username": "alice", "user_profiles": [profile]}))
+        self.assertIsNone(response.data["plan"]["steps"][0]["changed_keys"])
+
+        response = self.skill.bus.wait_for_response(
+            Message("neon.data_controls.get_erase_plan",
+                    {"data_to_remove": ["INVALID"]}))
+        self.assertIsNotNone(response.data["error"])
+        self.assertNotIn("plan", response.data)
+        self.skill.update_profile = real_update_profile
+
     def test_clear_user_data(self):
         test_config_path = join(dirname(__file__), "test_config",
                                 "test_config.yml")